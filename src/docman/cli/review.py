@@ -993,12 +993,17 @@ def _handle_bulk_apply(
 
     # Check for unaligned paths and show summary warning
     if folder_defs:
-        unaligned_count = sum(
-            1 for op, _ in pending_ops
-            if not check_path_alignment(
-                op.suggested_directory_path, folder_defs, var_patterns
-            )[0]
-        )
+        # Alignment depends only on the directory, so check each distinct one once
+        alignment_by_dir: dict[str, bool] = {}
+        unaligned_count = 0
+        for op, _ in pending_ops:
+            suggested_dir = op.suggested_directory_path
+            if suggested_dir not in alignment_by_dir:
+                alignment_by_dir[suggested_dir] = check_path_alignment(
+                    suggested_dir, folder_defs, var_patterns
+                )[0]
+            if not alignment_by_dir[suggested_dir]:
+                unaligned_count += 1
         if unaligned_count > 0:
             click.secho(
                 f"⚠️  {unaligned_count} path(s) don't align with folder structure",
@@ -4,19 +4,9 @@ This module validates whether a suggested directory path aligns with
 the folder structure defined in the repository configuration.
 """
 
-from .repo_config import FolderDefinition, VariablePattern
+from collections.abc import Mapping
 
-
-def _is_variable_pattern(folder_name: str) -> bool:
-    """Check if a folder name is a variable pattern placeholder.
-
-    Args:
-        folder_name: The folder name to check (e.g., "{year}", "invoices").
-
-    Returns:
-        True if it's a variable pattern (e.g., "{year}"), False otherwise.
-    """
-    return folder_name.startswith("{") and folder_name.endswith("}")
+from .repo_config import FolderDefinition, VariablePattern, is_variable_pattern
 
 
 def _extract_variable_name(pattern: str) -> str:
@@ -34,7 +24,7 @@ def _extract_variable_name(pattern: str) -> str:
 def _check_value_against_pattern(
     value: str,
     var_name: str,
-    var_patterns: dict[str, VariablePattern],
+    var_patterns: Mapping[str, VariablePattern],
 ) -> tuple[bool, str | None]:
     """Check if a value is valid for a variable pattern.
 
@@ -59,11 +49,8 @@ def _check_value_against_pattern(
         return True, None
 
     # Check against predefined values and their aliases
-    for pattern_value in pattern.values:
-        if value == pattern_value.value:
-            return True, None
-        if value in pattern_value.aliases:
-            return True, None
+    if value in pattern.known_values:
+        return True, None
 
     return (
         False,
@@ -73,8 +60,8 @@ def _check_value_against_pattern(
 
 def check_path_alignment(
     suggested_dir: str,
-    folder_defs: dict[str, FolderDefinition],
-    var_patterns: dict[str, VariablePattern],
+    folder_defs: Mapping[str, FolderDefinition],
+    var_patterns: Mapping[str, VariablePattern],
 ) -> tuple[bool, str | None]:
     """Check if a suggested directory path aligns with the defined folder structure.
 
@@ -126,7 +113,7 @@ def check_path_alignment(
         else:
             # Look for variable patterns at this level
             for folder_name, folder_def in current_level.items():
-                if _is_variable_pattern(folder_name):
+                if is_variable_pattern(folder_name):
                     # This is a variable pattern - it can match any value
                     var_name = _extract_variable_name(folder_name)
 
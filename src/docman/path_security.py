@@ -5,8 +5,15 @@ This module provides security validation for LLM-suggested file paths to prevent
 path traversal attacks and ensure all file operations remain within the repository.
 """
 
+import re
 from pathlib import Path
 
+# OS-specific invalid characters
+# Windows: < > : " | ? *
+# Unix: generally more permissive, but we'll use conservative set
+# (null bytes are rejected separately with a dedicated error message)
+_INVALID_CHARS_RE = re.compile(r'[<>:"|?*]')
+
 
 class PathSecurityError(Exception):
     """Raised when path validation fails due to security concerns."""
@@ -63,14 +70,11 @@ def validate_path_component(path_str: str, allow_empty: bool = False) -> str:
         )
 
     # Check for OS-specific invalid characters
-    # Windows: < > : " | ? *
-    # Unix: generally more permissive, but we'll use conservative set
-    invalid_chars = {"<", ">", ":", '"', "|", "?", "*", "\0"}
-    for char in invalid_chars:
-        if char in path_str:
-            raise PathSecurityError(
-                f"Path component contains invalid character '{char}': {path_str}"
-            )
+    invalid_char = _INVALID_CHARS_RE.search(path_str)
+    if invalid_char:
+        raise PathSecurityError(
+            f"Path component contains invalid character '{invalid_char.group()}': {path_str}"
+        )
 
     return path_str
 
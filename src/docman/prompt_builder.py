@@ -5,16 +5,19 @@ organization tasks, keeping prompt logic separate from LLM providers.
 """
 
 import functools
+import heapq
 import json
+import os
+import re
 from html import escape
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import click
-from jinja2 import Environment, PackageLoader
+from jinja2 import Environment, PackageLoader, Template
 
 from docman.llm_providers import OrganizationSuggestion
-from docman.repo_config import FolderDefinition
+from docman.repo_config import FolderDefinition, is_variable_pattern
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -22,6 +25,38 @@ if TYPE_CHECKING:
 # Initialize Jinja2 template environment
 _template_env = Environment(loader=PackageLoader("docman", "prompt_templates"))
 
+# Matches {variable} placeholders in folder names and filename conventions
+_VARIABLE_RE = re.compile(r"\{(\w+)\}")
+
+# Marker inserted where _truncate_content_smart drops content; the system prompt
+# tells the LLM how to interpret it
+_TRUNCATION_MARKER = "\n\n<<<DOCMAN_TRUNCATION: {:,} characters omitted>>>\n\n"
+
+# Maximum number of existing directory values listed per variable folder
+_MAX_EXISTING_VALUES = 10
+
+# Rendered system prompts keyed by use_structured_output (see build_system_prompt)
+_system_prompts: dict[bool, str] = {}
+
+# Variable pattern guidance keyed by (repo_root, variable, repo config version)
+_pattern_guidance_cache: dict[tuple[str, str, str], str] = {}
+
+
+@functools.cache
+def _get_template(name: str) -> Template:
+    """Load and compile a prompt template once per process.
+
+    Environment.get_template() re-checks the template source on disk on every
+    call, which is wasted work for the user prompt rendered once per document.
+
+    Args:
+        name: Template filename within the prompt_templates package.
+
+    Returns:
+        The compiled Jinja2 template.
+    """
+    return _template_env.get_template(name)
+
 
 def _truncate_content_smart(
     content: str,
@@ -62,7 +97,7 @@ def _truncate_content_smart(
 
     # Calculate marker with actual omitted count
     omitted = len(content) - max_chars
-    marker = f"\n\n<<<DOCMAN_TRUNCATION: {omitted:,} characters omitted>>>\n\n"
+    marker = _TRUNCATION_MARKER.format(omitted)
 
     # Split remaining space according to head_ratio
     available = max_chars - len(marker)
@@ -72,26 +107,28 @@ def _truncate_content_smart(
     head_chars = int(available * head_ratio)
     tail_chars = available - head_chars
 
-    # Find paragraph boundaries for clean breaks
+    # Find paragraph boundaries for clean breaks, searching in place so the
+    # head/tail windows are not copied before the boundary is known
     if head_chars > 0:
-        head_content = content[:head_chars]
-        if "\n\n" in head_content:
-            head = head_content.rsplit("\n\n", 1)[0]
+        boundary = content.rfind("\n\n", 0, head_chars)
+        if boundary != -1:
+            head = content[:boundary]
         else:
-            head = head_content.rstrip()
+            head = content[:head_chars].rstrip()
     else:
         head = ""
 
     if tail_chars > 0:
-        tail_content = content[-tail_chars:]
-        if "\n\n" in tail_content:
-            tail = tail_content.split("\n\n", 1)[-1]
+        tail_start = len(content) - tail_chars
+        boundary = content.find("\n\n", tail_start)
+        if boundary != -1:
+            tail = content[boundary + 2 :]
         else:
-            tail = tail_content.lstrip()
+            tail = content[tail_start:].lstrip()
     else:
         tail = ""
 
-    result = f"{head}{marker}{tail}"
+    result = "".join((head, marker, tail))
     return result, True, len(content), len(result)
 
 
@@ -200,7 +237,10 @@ def _render_folder_hierarchy(
     existing_dirs: dict[str, list[str]] | None = None,
     current_path: str = "",
 ) -> str:
-    """Recursively render folder hierarchy as markdown list.
+    """Render folder hierarchy as markdown list.
+
+    All levels append to one shared list of lines that is joined once, rather
+    than joining and re-embedding the output of every nested level.
 
     Args:
         folders: Dictionary of folder names to FolderDefinition objects.
@@ -211,36 +251,34 @@ def _render_folder_hierarchy(
     Returns:
         Markdown-formatted folder tree.
     """
-    lines = []
-    prefix = "  " * indent
+    lines: list[str] = []
 
-    for name, definition in folders.items():
-        # Build full path for this folder
-        if current_path:
-            folder_path = f"{current_path}/{name}"
-        else:
-            folder_path = name
+    def render_level(
+        folder_dict: dict[str, FolderDefinition], level: int, path_prefix: str
+    ) -> None:
+        """Recursively append the lines for one level of the folder tree."""
+        prefix = "  " * level
 
-        # Add folder name and description (only if description is present)
-        if definition.description:
-            lines.append(f"{prefix}- **{name}/** - {definition.description}")
-        else:
-            lines.append(f"{prefix}- **{name}/**")
-
-        # Show existing values for variable pattern folders
-        if existing_dirs and folder_path in existing_dirs:
-            values = existing_dirs[folder_path]
-            values_str = ", ".join(values)
-            lines.append(f"{prefix}  Existing: {values_str}")
-
-        # Recursively add subfolders
-        if definition.folders:
-            lines.append(
-                _render_folder_hierarchy(
-                    definition.folders, indent + 1, existing_dirs, folder_path
-                )
-            )
+        for name, definition in folder_dict.items():
+            # Build full path for this folder
+            folder_path = f"{path_prefix}/{name}" if path_prefix else name
+
+            # Add folder name and description (only if description is present)
+            if definition.description:
+                lines.append(f"{prefix}- **{name}/** - {definition.description}")
+            else:
+                lines.append(f"{prefix}- **{name}/**")
+
+            # Show existing values for variable pattern folders
+            if existing_dirs and folder_path in existing_dirs:
+                values_str = ", ".join(existing_dirs[folder_path])
+                lines.append(f"{prefix}  Existing: {values_str}")
 
+            # Recursively add subfolders
+            if definition.folders:
+                render_level(definition.folders, level + 1, folder_path)
+
+    render_level(folders, indent, current_path)
     return "\n".join(lines)
 
 
@@ -295,43 +333,54 @@ def _extract_variable_patterns(
     Returns:
         Dictionary mapping variable patterns to extraction guidance.
     """
-    import re
+    # Resolve guidance once per distinct variable, however often it is referenced
+    variable_names = _collect_variable_names(folders, default_filename_convention)
+    return {name: _get_pattern_guidance(name, repo_root) for name in variable_names}
 
-    patterns = {}
 
-    def collect_patterns(folder_dict: dict[str, FolderDefinition]) -> None:
-        """Recursively collect patterns from folder structure."""
+def _collect_variable_names(
+    folders: dict[str, FolderDefinition],
+    default_filename_convention: str | None = None,
+) -> list[str]:
+    """Collect distinct variable names referenced by folders and filename conventions.
+
+    Args:
+        folders: Dictionary of folder names to FolderDefinition objects.
+        default_filename_convention: Optional default filename convention.
+
+    Returns:
+        Variable names in order of first appearance (depth-first), without duplicates.
+    """
+    # dict keys keep first-seen order, which determines the prompt section order
+    names: dict[str, None] = {}
+
+    def collect_names(folder_dict: dict[str, FolderDefinition]) -> None:
+        """Recursively collect variable names from folder structure."""
         for name, definition in folder_dict.items():
-            # Check if folder name contains variables (e.g., {year}, {category})
-            if "{" in name and "}" in name:
-                # Extract variable name
-                matches = re.findall(r"\{(\w+)\}", name)
-                for var_name in matches:
-                    if var_name not in patterns:
-                        patterns[var_name] = _get_pattern_guidance(var_name, repo_root)
+            # Check if folder name contains variables (e.g., {year}, {category}).
+            # Whole-name placeholders are the common case and are sliced directly;
+            # the regex handles embedded, multiple and malformed placeholders.
+            if is_variable_pattern(name):
+                names.setdefault(name[1:-1])
+            elif "{" in name and "}" in name:
+                names.update(dict.fromkeys(_VARIABLE_RE.findall(name)))
 
             # Check if filename convention contains variables
             if definition.filename_convention and "{" in definition.filename_convention:
-                matches = re.findall(r"\{(\w+)\}", definition.filename_convention)
-                for var_name in matches:
-                    if var_name not in patterns:
-                        patterns[var_name] = _get_pattern_guidance(var_name, repo_root)
+                names.update(dict.fromkeys(_VARIABLE_RE.findall(definition.filename_convention)))
 
             # Recurse into subfolders
             if definition.folders:
-                collect_patterns(definition.folders)
+                collect_names(definition.folders)
 
     # Collect from folder structure
-    collect_patterns(folders)
+    collect_names(folders)
 
     # Also check default filename convention
     if default_filename_convention and "{" in default_filename_convention:
-        matches = re.findall(r"\{(\w+)\}", default_filename_convention)
-        for var_name in matches:
-            if var_name not in patterns:
-                patterns[var_name] = _get_pattern_guidance(var_name, repo_root)
+        names.update(dict.fromkeys(_VARIABLE_RE.findall(default_filename_convention)))
 
-    return patterns
+    return list(names)
 
 
 def _get_pattern_guidance(variable_name: str, repo_root: Path) -> str:
@@ -340,6 +389,10 @@ def _get_pattern_guidance(variable_name: str, repo_root: Path) -> str:
     Loads user-defined pattern from repository config. If pattern is not defined,
     displays a warning to the user and returns LLM-friendly fallback guidance.
 
+    Guidance for defined patterns is cached per repository and variable, keyed
+    by the repository config version so that edits to the config invalidate it.
+    Undefined patterns are not cached, so every lookup reports them.
+
     Args:
         variable_name: The variable name (e.g., "year", "category").
         repo_root: The repository root directory.
@@ -348,6 +401,40 @@ def _get_pattern_guidance(variable_name: str, repo_root: Path) -> str:
         Guidance text for extracting this variable. Either user-defined description
         or fallback instruction to infer from context.
     """
+    from docman.repo_config import get_repo_config_version
+
+    key = (str(repo_root), variable_name, get_repo_config_version(repo_root))
+    guidance = _pattern_guidance_cache.get(key)
+    if guidance is None:
+        guidance = _build_pattern_guidance(variable_name, repo_root)
+        if guidance is None:
+            # Display user-facing warning
+            click.secho(
+                f"⚠️  Variable pattern '{variable_name}' is undefined - "
+                "LLM will infer from context",
+                fg="yellow",
+            )
+            click.echo(
+                f"    Tip: Define with: docman pattern add {variable_name} --desc '...'"
+            )
+
+            # Return LLM-friendly fallback guidance
+            return f"\n  - Infer {variable_name} from document context"
+        _pattern_guidance_cache[key] = guidance
+    return guidance
+
+
+def _build_pattern_guidance(variable_name: str, repo_root: Path) -> str | None:
+    """Build uncached extraction guidance for a defined variable pattern.
+
+    Args:
+        variable_name: The variable name (e.g., "year", "category").
+        repo_root: The repository root directory.
+
+    Returns:
+        Guidance text for extracting this variable, or None if the pattern is
+        not defined in the repository config.
+    """
     from docman.repo_config import get_variable_patterns
 
     # Load user-defined patterns
@@ -355,17 +442,7 @@ def _get_pattern_guidance(variable_name: str, repo_root: Path) -> str:
 
     # Check if pattern is defined
     if variable_name not in patterns:
-        # Display user-facing warning
-        click.secho(
-            f"⚠️  Variable pattern '{variable_name}' is undefined - LLM will infer from context",
-            fg="yellow",
-        )
-        click.echo(
-            f"    Tip: Define with: docman pattern add {variable_name} --desc '...'"
-        )
-
-        # Return LLM-friendly fallback guidance
-        return f"\n  - Infer {variable_name} from document context"
+        return None
 
     # Get the pattern object
     pattern = patterns[variable_name]
@@ -404,15 +481,52 @@ def _detect_existing_directories(
         repo_root: The repository root directory.
 
     Returns:
-        Dictionary mapping folder paths (containing variable patterns) to lists
-        of existing directory names found on disk.
+        Dictionary mapping folder paths (containing variable patterns) to the
+        first _MAX_EXISTING_VALUES existing directory names found on disk, sorted
+        alphabetically.
     """
     existing: dict[str, list[str]] = {}
+    # Directory listings for this call, so a directory reached through both a
+    # literal folder and a sibling variable folder is only scanned once
+    listings: dict[str, list[tuple[str, str]]] = {}
+
+    def list_subdirectories(disk_path: str) -> list[tuple[str, str]]:
+        """List visible subdirectories of a disk path as (name, path) pairs.
+
+        Args:
+            disk_path: Directory to list.
+
+        Returns:
+            Non-hidden, non-symlink subdirectories, or an empty list if the path
+            is missing, not a directory, or unreadable.
+        """
+        cached = listings.get(disk_path)
+        if cached is not None:
+            return cached
+
+        subdirectories: list[tuple[str, str]] = []
+        # scandir reuses the file type from the directory listing, so
+        # is_dir() needs no extra stat call
+        try:
+            with os.scandir(disk_path) as entries:
+                for entry in entries:
+                    # Skip hidden directories and files
+                    if entry.name.startswith("."):
+                        continue
+                    # Only include real directories; symlinks may point
+                    # outside the repository or loop back on themselves
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append((entry.name, entry.path))
+        except OSError:
+            pass  # Skip missing, non-directory or unreadable paths
+
+        listings[disk_path] = subdirectories
+        return subdirectories
 
     def collect_existing(
         folder_dict: dict[str, FolderDefinition],
         current_path: str = "",
-        disk_paths: list[Path] | None = None,
+        disk_paths: list[str] | None = None,
     ) -> None:
         """Recursively collect existing directories for variable patterns.
 
@@ -422,7 +536,7 @@ def _detect_existing_directories(
             disk_paths: List of actual disk paths to check (handles variable expansion).
         """
         if disk_paths is None:
-            disk_paths = [repo_root]
+            disk_paths = [str(repo_root)]
 
         for name, definition in folder_dict.items():
             # Build path to this folder (with placeholders)
@@ -432,36 +546,28 @@ def _detect_existing_directories(
                 folder_path = name
 
             # Check if this folder name is a variable pattern
-            if "{" in name and "}" in name:
+            if is_variable_pattern(name):
                 # Collect values from all current disk paths
                 all_values: set[str] = set()
-                next_disk_paths: list[Path] = []
+                next_disk_paths: list[str] = []
 
                 for disk_path in disk_paths:
-                    if disk_path.exists() and disk_path.is_dir():
-                        try:
-                            for item in disk_path.iterdir():
-                                # Skip hidden directories and files
-                                if item.name.startswith("."):
-                                    continue
-                                # Only include directories
-                                if item.is_dir():
-                                    all_values.add(item.name)
-                                    next_disk_paths.append(item)
-                        except PermissionError:
-                            pass  # Skip directories we can't read
-
-                # Sort alphabetically and limit to 10
+                    for entry_name, entry_path in list_subdirectories(disk_path):
+                        all_values.add(entry_name)
+                        next_disk_paths.append(entry_path)
+
+                # Keep the alphabetically first values without sorting them all
                 if all_values:
-                    sorted_values = sorted(all_values)
-                    existing[folder_path] = sorted_values[:10]
+                    existing[folder_path] = heapq.nsmallest(
+                        _MAX_EXISTING_VALUES, all_values
+                    )
 
                 # Recurse into subfolders with expanded disk paths
                 if definition.folders:
                     collect_existing(definition.folders, folder_path, next_disk_paths)
             else:
                 # Literal folder name - update disk paths accordingly
-                next_disk_paths = [dp / name for dp in disk_paths]
+                next_disk_paths = [os.path.join(dp, name) for dp in disk_paths]
 
                 # Recurse into subfolders
                 if definition.folders:
@@ -665,11 +771,11 @@ def format_examples(
     return "\n\n".join(formatted_examples)
 
 
-@functools.lru_cache(maxsize=2)
 def build_system_prompt(use_structured_output: bool = False) -> str:
     """Build the static system prompt that defines the LLM's task.
 
-    This prompt is cached for both structured and unstructured output modes.
+    The prompt is rendered once per output mode and then served from
+    _system_prompts until clear_prompt_cache() is called.
 
     Args:
         use_structured_output: If True, omits JSON formatting instructions
@@ -679,7 +785,23 @@ def build_system_prompt(use_structured_output: bool = False) -> str:
     Returns:
         System prompt string defining the document organization task.
     """
-    template = _template_env.get_template("system_prompt.j2")
+    prompt = _system_prompts.get(use_structured_output)
+    if prompt is None:
+        prompt = _render_system_prompt(use_structured_output)
+        _system_prompts[use_structured_output] = prompt
+    return prompt
+
+
+def _render_system_prompt(use_structured_output: bool) -> str:
+    """Render the system prompt template for one output mode.
+
+    Args:
+        use_structured_output: Whether the provider enforces the response schema.
+
+    Returns:
+        The rendered system prompt.
+    """
+    template = _get_template("system_prompt.j2")
 
     # Generate schema example only when needed (for unstructured output)
     json_schema_example = None
@@ -719,7 +841,7 @@ def build_user_prompt(
     )
 
     # Render template
-    template = _template_env.get_template("user_prompt.j2")
+    template = _get_template("user_prompt.j2")
     return template.render(
         file_path=file_path,
         content=content,
@@ -735,7 +857,9 @@ def clear_prompt_cache() -> None:
 
     Useful for testing or when templates are modified during development.
     """
-    build_system_prompt.cache_clear()
+    _system_prompts.clear()
+    _pattern_guidance_cache.clear()
+    _get_template.cache_clear()
 
 
 def compute_prompt_hash(
@@ -4,12 +4,23 @@ This module handles reading and writing repository-specific configuration,
 particularly folder definitions stored in .docman/config.yaml.
 """
 
+import copy
+import hashlib
+import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Most recently parsed config as (config path, file content, parsed config). A
+# docman invocation works on one repository, so a single entry is enough.
+_config_cache: tuple[Path, str, dict[str, Any]] | None = None
+
+# A folder name that is a single {word} placeholder, e.g. {year}
+_VARIABLE_FOLDER_RE = re.compile(r"\{\w+\}")
+
 
 @dataclass
 class PatternValue:
@@ -40,7 +51,7 @@ class PatternValue:
         return cls(
             value=data["value"],
             description=data.get("description"),
-            aliases=data.get("aliases", []),
+            aliases=list(data.get("aliases", [])),
         )
 
 
@@ -56,6 +67,19 @@ class VariablePattern:
     description: str
     values: list[PatternValue] = field(default_factory=list)
 
+    @cached_property
+    def known_values(self) -> frozenset[str]:
+        """All canonical values and aliases, for O(1) membership checks.
+
+        Computed on first access; patterns are built from config and not
+        mutated afterwards, so the cached set stays in sync with ``values``.
+        """
+        known: set[str] = set()
+        for pattern_value in self.values:
+            known.add(pattern_value.value)
+            known.update(pattern_value.aliases)
+        return frozenset(known)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation for YAML serialization.
 
@@ -86,7 +110,7 @@ class VariablePattern:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderDefinition:
     """Represents a folder with its description and nested subfolders.
 
@@ -151,6 +175,22 @@ class FolderDefinition:
         )
 
 
+def is_variable_pattern(folder_name: str) -> bool:
+    """Check if a folder name is a variable pattern placeholder.
+
+    Only a single {word} placeholder counts, matching how variable names are
+    extracted from names and filename conventions. Malformed names such as
+    "{}", "{ year }" or "{fiscal-year}" are literal folders.
+
+    Args:
+        folder_name: The folder name to check (e.g., "{year}", "invoices").
+
+    Returns:
+        True if it's a variable pattern (e.g., "{year}"), False otherwise.
+    """
+    return _VARIABLE_FOLDER_RE.fullmatch(folder_name) is not None
+
+
 def get_repo_config_path(repo_root: Path) -> Path:
     """Get the path to the repository's config file.
 
@@ -163,8 +203,33 @@ def get_repo_config_path(repo_root: Path) -> Path:
     return repo_root / ".docman" / "config.yaml"
 
 
-def load_repo_config(repo_root: Path) -> dict[str, Any]:
-    """Load repository configuration from .docman/config.yaml.
+def get_repo_config_version(repo_root: Path) -> str:
+    """Get a token that changes whenever the repository config changes.
+
+    The token is a hash of the config file's contents, so it also notices
+    edits made outside docman that keep the same size and modification time.
+
+    Args:
+        repo_root: The repository root directory.
+
+    Returns:
+        SHA-256 hex digest of config.yaml, or an empty string if the file does
+        not exist.
+    """
+    try:
+        content = get_repo_config_path(repo_root).read_bytes()
+    except OSError:
+        return ""
+    return hashlib.sha256(content).hexdigest()
+
+
+def _read_repo_config(repo_root: Path) -> dict[str, Any]:
+    """Load repository configuration, reusing the last parse if unchanged.
+
+    The file is read on every call and compared with the cached content, so
+    the result is never stale. Only YAML parsing is skipped when the content
+    has not changed. The returned dict may be shared with later calls and
+    must not be modified; use load_repo_config() for a private copy.
 
     Args:
         repo_root: The repository root directory.
@@ -176,18 +241,24 @@ def load_repo_config(repo_root: Path) -> dict[str, Any]:
     Raises:
         ValueError: If the YAML file contains syntax errors.
     """
+    global _config_cache
+
     config_path = get_repo_config_path(repo_root)
 
     if not config_path.exists():
         return {}
 
     content = config_path.read_text()
+    if _config_cache is not None:
+        cached_path, cached_content, cached_config = _config_cache
+        if cached_path == config_path and cached_content == content:
+            return cached_config
+
     if not content.strip():
         return {}
 
     try:
-        config = yaml.safe_load(content)
-        return config if config is not None else {}
+        config: dict[str, Any] | None = yaml.safe_load(content)
     except yaml.YAMLError as e:
         # Provide actionable error message for invalid YAML
         raise ValueError(
@@ -196,6 +267,30 @@ def load_repo_config(repo_root: Path) -> dict[str, Any]:
             f"Error: {e}"
         ) from e
 
+    if config is None:
+        return {}
+    _config_cache = (config_path, content, config)
+    return config
+
+
+def load_repo_config(repo_root: Path) -> dict[str, Any]:
+    """Load repository configuration from .docman/config.yaml.
+
+    Returns a deep copy of the cached parse (see _read_repo_config), so
+    callers may modify the result before passing it to save_repo_config().
+
+    Args:
+        repo_root: The repository root directory.
+
+    Returns:
+        Dictionary containing configuration data. Returns empty dict if file
+        doesn't exist or is empty.
+
+    Raises:
+        ValueError: If the YAML file contains syntax errors.
+    """
+    return copy.deepcopy(_read_repo_config(repo_root))
+
 
 def save_repo_config(repo_root: Path, config: dict[str, Any]) -> None:
     """Save repository configuration to .docman/config.yaml.
@@ -305,7 +400,7 @@ def get_folder_definitions(repo_root: Path) -> dict[str, FolderDefinition]:
     Raises:
         ValueError: If the folder structure contains duplicate variable patterns.
     """
-    config = load_repo_config(repo_root)
+    config = _read_repo_config(repo_root)
     organization = config.get("organization", {})
     folders_data = organization.get("folders", {})
 
@@ -393,7 +488,7 @@ def get_default_filename_convention(repo_root: Path) -> str | None:
     Returns:
         Default filename convention string, or None if not set.
     """
-    config = load_repo_config(repo_root)
+    config = _read_repo_config(repo_root)
     organization = config.get("organization", {})
     convention = organization.get("default_filename_convention")
     return convention if isinstance(convention, str) else None
@@ -440,7 +535,7 @@ def get_variable_patterns(repo_root: Path) -> dict[str, VariablePattern]:
         Dictionary mapping variable names to VariablePattern objects.
         Returns empty dict if no patterns defined.
     """
-    config = load_repo_config(repo_root)
+    config = _read_repo_config(repo_root)
     organization = config.get("organization", {})
     patterns_data = organization.get("variable_patterns", {})
 
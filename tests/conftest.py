@@ -1,10 +1,39 @@
 """Shared pytest fixtures and test utilities for docman."""
 
+from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 from click.testing import CliRunner
 from pytest import MonkeyPatch
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def _set_fast_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Disable SQLite durability features for throwaway test databases.
+
+    Tests never need to survive a crash, so skipping fsync and the on-disk
+    rollback journal makes each commit close to in-memory speed.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_sqlite() -> Generator[None, None, None]:
+    """Apply fast, non-durable SQLite pragmas to every engine created during tests.
+
+    Yields:
+        None: The listener stays registered for the whole test session.
+    """
+    event.listen(Engine, "connect", _set_fast_sqlite_pragmas)
+    yield
+    event.remove(Engine, "connect", _set_fast_sqlite_pragmas)
 
 
 @pytest.fixture(autouse=True, scope="function")
@@ -61,6 +90,21 @@ def config_file_name() -> str:
     return "config.yaml"
 
 
+def create_docman_skeleton(path: Path) -> Path:
+    """Create a minimal .docman directory with an empty config file.
+
+    Args:
+        path: The repository root to initialize.
+
+    Returns:
+        Path: The created .docman directory.
+    """
+    docman_dir = path / ".docman"
+    docman_dir.mkdir()
+    (docman_dir / "config.yaml").touch()
+    return docman_dir
+
+
 def assert_docman_initialized(path: Path) -> None:
     """Assert that a docman repository is properly initialized at the given path.
 
@@ -124,6 +124,7 @@ organization:
         assert result.exit_code != 0
         assert "outside the repository" in result.output
 
+    @pytest.mark.slow
     def test_debug_prompt_no_instructions(
         self, cli_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -177,6 +178,7 @@ organization:
         # Should show the system prompt content
         assert "document management specialist" in result.output.lower()
 
+    @pytest.mark.slow
     def test_debug_prompt_with_new_document(
         self, cli_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
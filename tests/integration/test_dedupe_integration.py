@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
+from conftest import create_docman_skeleton
 
 from docman.cli import main
 from docman.database import ensure_database, get_session
@@ -15,14 +16,7 @@ class TestDocmanDedupe:
 
     def setup_repository(self, path: Path) -> None:
         """Set up a docman repository for testing."""
-        docman_dir = path / ".docman"
-        docman_dir.mkdir()
-        config_file = docman_dir / "config.yaml"
-        config_file.touch()
-
-        # Create instructions file (required)
-        instructions_file = docman_dir / "instructions.md"
-        instructions_file.write_text("Test organization instructions")
+        create_docman_skeleton(path)
 
     def setup_isolated_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
         """Set up isolated environment with separate app config and repository."""
@@ -1302,6 +1302,37 @@ organization:
         # Should show alignment warning
         assert "don't align with folder structure" in result.output
 
+    def test_bulk_apply_checks_alignment_once_per_directory(
+        self, cli_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that bulk apply checks each distinct suggested directory only once."""
+        repo_dir = self.setup_isolated_env(tmp_path, monkeypatch)
+        monkeypatch.chdir(repo_dir)
+
+        # Create two source files suggested into the same unaligned directory
+        (repo_dir / "inbox").mkdir()
+        for name in ("a.pdf", "b.pdf"):
+            (repo_dir / "inbox" / name).write_text(f"content {name}")
+            self.create_pending_operation(
+                repo_path=str(repo_dir),
+                file_path=f"inbox/{name}",
+                suggested_dir="UnknownFolder",
+                suggested_filename=name,
+            )
+
+        with patch(
+            "docman.cli.review.check_path_alignment",
+            return_value=(False, "not aligned"),
+        ) as mock_check:
+            result = cli_runner.invoke(
+                main, ["review", "--apply-all", "-y"], catch_exceptions=False
+            )
+
+        assert result.exit_code == 0
+        # Both operations are counted, but the directory is only checked once
+        assert "2 path(s) don't align with folder structure" in result.output
+        mock_check.assert_called_once()
+
     def test_bulk_apply_no_warning_for_aligned_path(
         self, cli_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
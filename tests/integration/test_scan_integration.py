@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from click.testing import CliRunner
+from conftest import create_docman_skeleton
 
 from docman.cli import main
 from docman.database import get_session
@@ -16,14 +17,7 @@ class TestDocmanScan:
 
     def setup_repository(self, path: Path) -> None:
         """Set up a docman repository for testing."""
-        docman_dir = path / ".docman"
-        docman_dir.mkdir()
-        config_file = docman_dir / "config.yaml"
-        config_file.touch()
-
-        # Create instructions file (required for plan, not scan)
-        instructions_file = docman_dir / "instructions.md"
-        instructions_file.write_text("Test organization instructions")
+        create_docman_skeleton(path)
 
     def setup_isolated_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
         """Set up isolated environment with separate app config and repository."""
@@ -34,6 +28,7 @@ class TestDocmanScan:
         self.setup_repository(repo_dir)
         return repo_dir
 
+    @pytest.mark.slow
     @patch("docman.processor.extract_content")
     def test_scan_success_with_documents(
         self,
@@ -87,6 +82,7 @@ class TestDocmanScan:
             except StopIteration:
                 pass
 
+    @pytest.mark.slow
     @patch("docman.processor.extract_content")
     def test_scan_skips_already_scanned(
         self,
@@ -119,6 +115,7 @@ class TestDocmanScan:
         assert "Skipped (already scanned): 1" in result.output
         assert "New documents: 0" in result.output
 
+    @pytest.mark.slow
     @patch("docman.processor.extract_content")
     def test_scan_non_recursive_by_default(
         self,
@@ -168,6 +165,7 @@ class TestDocmanScan:
             except StopIteration:
                 pass
 
+    @pytest.mark.slow
     @patch("docman.processor.extract_content")
     def test_scan_with_rescan_flag(
         self,
@@ -259,6 +257,7 @@ class TestDocmanScan:
         assert "Error" in result.output
         assert "Not in a docman repository" in result.output
 
+    @pytest.mark.slow
     @patch("docman.processor.extract_content")
     def test_scan_single_file(
         self,
@@ -306,6 +305,7 @@ class TestDocmanScan:
             except StopIteration:
                 pass
 
+    @pytest.mark.slow
     @patch("docman.processor.extract_content")
     def test_scan_directory_path(
         self,
@@ -345,6 +345,7 @@ class TestDocmanScan:
         # Should show as already scanned
         assert "Skipped (already scanned): 1" in result.output
 
+    @pytest.mark.slow
     @patch("docman.processor.extract_content")
     def test_scan_batch_commits(
         self,
@@ -397,6 +398,7 @@ class TestDocmanScan:
             except StopIteration:
                 pass
 
+    @pytest.mark.slow
     @patch("docman.processor.extract_content")
     def test_scan_batch_commit_error_handling(
         self,
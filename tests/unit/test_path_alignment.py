@@ -1,46 +1,68 @@
 """Unit tests for path alignment validation."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import pytest
 
 from docman.path_alignment import (
     _check_value_against_pattern,
     _extract_variable_name,
-    _is_variable_pattern,
     check_path_alignment,
 )
 from docman.repo_config import FolderDefinition, PatternValue, VariablePattern
 
-
-class TestIsVariablePattern:
-    """Tests for _is_variable_pattern helper function."""
-
-    def test_variable_pattern(self):
-        """Variable patterns are correctly identified."""
-        assert _is_variable_pattern("{year}") is True
-        assert _is_variable_pattern("{category}") is True
-        assert _is_variable_pattern("{company}") is True
-
-    def test_literal_folder(self):
-        """Literal folder names are not variable patterns."""
-        assert _is_variable_pattern("Financial") is False
-        assert _is_variable_pattern("invoices") is False
-        assert _is_variable_pattern("2024") is False
-
-    def test_partial_braces(self):
-        """Partial braces are not variable patterns."""
-        assert _is_variable_pattern("{year") is False
-        assert _is_variable_pattern("year}") is False
-        assert _is_variable_pattern("year") is False
+# Shared read-only empty mappings (check_path_alignment never mutates its inputs)
+EMPTY_FOLDER_DEFS: Mapping[str, FolderDefinition] = MappingProxyType({})
+EMPTY_VAR_PATTERNS: Mapping[str, VariablePattern] = MappingProxyType({})
+
+
+@pytest.fixture
+def financial_invoices_year() -> dict[str, FolderDefinition]:
+    """Folder tree Financial/invoices/{year}."""
+    return {
+        "Financial": FolderDefinition(
+            description="Financial docs",
+            folders={
+                "invoices": FolderDefinition(
+                    description="Invoices",
+                    folders={
+                        "{year}": FolderDefinition(description="Invoices by year")
+                    }
+                )
+            }
+        )
+    }
+
+
+@pytest.fixture
+def year_patterns() -> dict[str, VariablePattern]:
+    """Year pattern with predefined values 2024 and 2023."""
+    return {
+        "year": VariablePattern(
+            description="4-digit year",
+            values=[
+                PatternValue(value="2024"),
+                PatternValue(value="2023"),
+            ]
+        )
+    }
 
 
 class TestExtractVariableName:
     """Tests for _extract_variable_name helper function."""
 
-    def test_extract_name(self):
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("{year}", "year"),
+            ("{category}", "category"),
+            ("{company_name}", "company_name"),
+        ],
+    )
+    def test_extract_name(self, pattern: str, expected: str):
         """Variable names are correctly extracted."""
-        assert _extract_variable_name("{year}") == "year"
-        assert _extract_variable_name("{category}") == "category"
-        assert _extract_variable_name("{company_name}") == "company_name"
+        assert _extract_variable_name(pattern) == expected
 
 
 class TestCheckValueAgainstPattern:
@@ -48,8 +70,7 @@ class TestCheckValueAgainstPattern:
 
     def test_pattern_not_defined(self):
         """Returns valid when pattern is not defined (can't validate)."""
-        var_patterns: dict[str, VariablePattern] = {}
-        is_valid, warning = _check_value_against_pattern("2024", "year", var_patterns)
+        is_valid, warning = _check_value_against_pattern("2024", "year", EMPTY_VAR_PATTERNS)
         assert is_valid is True
         assert warning is None
 
@@ -62,18 +83,9 @@ class TestCheckValueAgainstPattern:
         assert is_valid is True
         assert warning is None
 
-    def test_value_matches_predefined(self):
+    def test_value_matches_predefined(self, year_patterns: dict[str, VariablePattern]):
         """Returns valid when value matches predefined value."""
-        var_patterns = {
-            "year": VariablePattern(
-                description="4-digit year",
-                values=[
-                    PatternValue(value="2024"),
-                    PatternValue(value="2023"),
-                ]
-            )
-        }
-        is_valid, warning = _check_value_against_pattern("2024", "year", var_patterns)
+        is_valid, warning = _check_value_against_pattern("2024", "year", year_patterns)
         assert is_valid is True
         assert warning is None
 
@@ -94,18 +106,9 @@ class TestCheckValueAgainstPattern:
         assert is_valid is True
         assert warning is None
 
-    def test_value_not_in_predefined(self):
+    def test_value_not_in_predefined(self, year_patterns: dict[str, VariablePattern]):
         """Returns warning when value is not in predefined list."""
-        var_patterns = {
-            "year": VariablePattern(
-                description="4-digit year",
-                values=[
-                    PatternValue(value="2024"),
-                    PatternValue(value="2023"),
-                ]
-            )
-        }
-        is_valid, warning = _check_value_against_pattern("2099", "year", var_patterns)
+        is_valid, warning = _check_value_against_pattern("2099", "year", year_patterns)
         assert is_valid is False
         assert warning is not None
         assert '"2099" is not a known value for {year}' in warning
@@ -116,11 +119,8 @@ class TestCheckPathAlignment:
 
     def test_no_folder_definitions(self):
         """Returns aligned when no folder definitions exist."""
-        folder_defs: dict[str, FolderDefinition] = {}
-        var_patterns: dict[str, VariablePattern] = {}
-
         is_aligned, warning = check_path_alignment(
-            "Financial/invoices/2024", folder_defs, var_patterns
+            "Financial/invoices/2024", EMPTY_FOLDER_DEFS, EMPTY_VAR_PATTERNS
         )
         assert is_aligned is True
         assert warning is None
@@ -130,13 +130,12 @@ class TestCheckPathAlignment:
         folder_defs = {
             "Financial": FolderDefinition(description="Financial docs")
         }
-        var_patterns: dict[str, VariablePattern] = {}
 
-        is_aligned, warning = check_path_alignment("", folder_defs, var_patterns)
+        is_aligned, warning = check_path_alignment("", folder_defs, EMPTY_VAR_PATTERNS)
         assert is_aligned is True
         assert warning is None
 
-        is_aligned, warning = check_path_alignment("  ", folder_defs, var_patterns)
+        is_aligned, warning = check_path_alignment("  ", folder_defs, EMPTY_VAR_PATTERNS)
         assert is_aligned is True
         assert warning is None
 
@@ -146,10 +145,9 @@ class TestCheckPathAlignment:
             "Financial": FolderDefinition(description="Financial docs"),
             "Personal": FolderDefinition(description="Personal docs"),
         }
-        var_patterns: dict[str, VariablePattern] = {}
 
         is_aligned, warning = check_path_alignment(
-            "Financial", folder_defs, var_patterns
+            "Financial", folder_defs, EMPTY_VAR_PATTERNS
         )
         assert is_aligned is True
         assert warning is None
@@ -165,97 +163,45 @@ class TestCheckPathAlignment:
                 }
             )
         }
-        var_patterns: dict[str, VariablePattern] = {}
 
         is_aligned, warning = check_path_alignment(
-            "Financial/invoices", folder_defs, var_patterns
+            "Financial/invoices", folder_defs, EMPTY_VAR_PATTERNS
         )
         assert is_aligned is True
         assert warning is None
 
-    def test_variable_pattern_match(self):
+    def test_variable_pattern_match(
+        self, financial_invoices_year: dict[str, FolderDefinition]
+    ):
         """Path matches variable pattern placeholder."""
-        folder_defs = {
-            "Financial": FolderDefinition(
-                description="Financial docs",
-                folders={
-                    "invoices": FolderDefinition(
-                        description="Invoices",
-                        folders={
-                            "{year}": FolderDefinition(description="Invoices by year")
-                        }
-                    )
-                }
-            )
-        }
-        var_patterns: dict[str, VariablePattern] = {}
-
         # Any value matches when pattern has no predefined values
         is_aligned, warning = check_path_alignment(
-            "Financial/invoices/2024", folder_defs, var_patterns
+            "Financial/invoices/2024", financial_invoices_year, EMPTY_VAR_PATTERNS
         )
         # Pattern without values is treated as valid (can't validate)
         assert is_aligned is True
         assert warning is None
 
-    def test_variable_pattern_with_valid_value(self):
+    def test_variable_pattern_with_valid_value(
+        self,
+        financial_invoices_year: dict[str, FolderDefinition],
+        year_patterns: dict[str, VariablePattern],
+    ):
         """Path matches variable pattern with valid predefined value."""
-        folder_defs = {
-            "Financial": FolderDefinition(
-                description="Financial docs",
-                folders={
-                    "invoices": FolderDefinition(
-                        description="Invoices",
-                        folders={
-                            "{year}": FolderDefinition(description="Invoices by year")
-                        }
-                    )
-                }
-            )
-        }
-        var_patterns = {
-            "year": VariablePattern(
-                description="4-digit year",
-                values=[
-                    PatternValue(value="2024"),
-                    PatternValue(value="2023"),
-                ]
-            )
-        }
-
         is_aligned, warning = check_path_alignment(
-            "Financial/invoices/2024", folder_defs, var_patterns
+            "Financial/invoices/2024", financial_invoices_year, year_patterns
         )
         assert is_aligned is True
         assert warning is None
 
-    def test_variable_pattern_with_invalid_value(self):
+    def test_variable_pattern_with_invalid_value(
+        self,
+        financial_invoices_year: dict[str, FolderDefinition],
+        year_patterns: dict[str, VariablePattern],
+    ):
         """Returns warning when value doesn't match predefined list."""
-        folder_defs = {
-            "Financial": FolderDefinition(
-                description="Financial docs",
-                folders={
-                    "invoices": FolderDefinition(
-                        description="Invoices",
-                        folders={
-                            "{year}": FolderDefinition(description="Invoices by year")
-                        }
-                    )
-                }
-            )
-        }
-        var_patterns = {
-            "year": VariablePattern(
-                description="4-digit year",
-                values=[
-                    PatternValue(value="2024"),
-                    PatternValue(value="2023"),
-                ]
-            )
-        }
-
         is_aligned, warning = check_path_alignment(
-            "Financial/invoices/2099", folder_defs, var_patterns
+            "Financial/invoices/2099", financial_invoices_year, year_patterns
         )
         assert is_aligned is False
         assert warning is not None
@@ -266,10 +212,9 @@ class TestCheckPathAlignment:
         folder_defs = {
             "Financial": FolderDefinition(description="Financial docs")
         }
-        var_patterns: dict[str, VariablePattern] = {}
 
         is_aligned, warning = check_path_alignment(
-            "Unknown", folder_defs, var_patterns
+            "Unknown", folder_defs, EMPTY_VAR_PATTERNS
         )
         assert is_aligned is False
         assert warning is not None
@@ -285,10 +230,9 @@ class TestCheckPathAlignment:
                 }
             )
         }
-        var_patterns: dict[str, VariablePattern] = {}
 
         is_aligned, warning = check_path_alignment(
-            "Financial/unknown", folder_defs, var_patterns
+            "Financial/unknown", folder_defs, EMPTY_VAR_PATTERNS
         )
         assert is_aligned is False
         assert warning is not None
@@ -299,11 +243,10 @@ class TestCheckPathAlignment:
         folder_defs = {
             "Financial": FolderDefinition(description="Financial docs")
         }
-        var_patterns: dict[str, VariablePattern] = {}
 
         # Path goes deeper than definition - should be allowed (shallow paths are valid)
         is_aligned, warning = check_path_alignment(
-            "Financial/invoices/2024", folder_defs, var_patterns
+            "Financial/invoices/2024", folder_defs, EMPTY_VAR_PATTERNS
         )
         assert is_aligned is True
         assert warning is None
@@ -313,11 +256,10 @@ class TestCheckPathAlignment:
         folder_defs = {
             "Financial": FolderDefinition(description="Financial docs")
         }
-        var_patterns: dict[str, VariablePattern] = {}
 
         # Leading/trailing slashes should be handled
         is_aligned, warning = check_path_alignment(
-            "/Financial/", folder_defs, var_patterns
+            "/Financial/", folder_defs, EMPTY_VAR_PATTERNS
         )
         assert is_aligned is True
         assert warning is None
@@ -332,11 +274,10 @@ class TestCheckPathAlignment:
                 }
             )
         }
-        var_patterns: dict[str, VariablePattern] = {}
 
         # Spaces in path components are stripped
         is_aligned, warning = check_path_alignment(
-            "Financial/invoices", folder_defs, var_patterns
+            "Financial/invoices", folder_defs, EMPTY_VAR_PATTERNS
         )
         # This won't match because the folder is literally " invoices " with spaces
         assert is_aligned is False
@@ -1,163 +1,152 @@
 """Unit tests for the processor module."""
 
+from collections.abc import Callable, Generator
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
 
 from docman.processor import extract_content
 
 
+@pytest.fixture(scope="module")
+def fake_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one empty PDF shared by the module (the converter is mocked, so it is never read)."""
+    test_file = tmp_path_factory.mktemp("processor") / "test.pdf"
+    test_file.touch()
+    return test_file
+
+
+@pytest.fixture(scope="module")
+def missing_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a path to a PDF that does not exist."""
+    return tmp_path_factory.mktemp("processor_missing") / "nonexistent.pdf"
+
+
 class TestExtractContent:
     """Tests for extract_content function."""
 
-    @patch("docling.document_converter.DocumentConverter")
-    def test_successful_extraction(self, mock_converter_class: Mock, tmp_path: Path) -> None:
+    @pytest.fixture(autouse=True)
+    def mock_converter_cls(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> Generator[tuple[Mock, Mock], None, None]:
+        """Replace docling's DocumentConverter with a mock class and instance.
+
+        extract_content imports DocumentConverter lazily from docling, so the
+        class is swapped on the docling module itself.
+
+        Yields:
+            The mock converter class and the instance it returns.
+        """
+        converter_cls = Mock()
+        converter = Mock(spec=["convert"])
+        converter_cls.return_value = converter
+        monkeypatch.setattr("docling.document_converter.DocumentConverter", converter_cls)
+        yield converter_cls, converter
+
+    def test_successful_extraction(
+        self, mock_converter_cls: tuple[Mock, Mock], fake_pdf: Path
+    ) -> None:
         """Test successful content extraction from a document."""
-        # Create a test file
-        test_file = tmp_path / "test.pdf"
-        test_file.touch()
-
-        # Mock the converter and its result
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
+        mock_converter_class, mock_converter = mock_converter_cls
 
-        # Mock the result object with document that has export_to_markdown method
-        mock_result = MagicMock()
-        mock_result.document.export_to_markdown.return_value = "Extracted content"
-        mock_converter.convert.return_value = mock_result
+        # Result object with document that has export_to_markdown method
+        export_to_markdown = Mock(return_value="Extracted content")
+        mock_converter.convert.return_value = SimpleNamespace(
+            document=SimpleNamespace(export_to_markdown=export_to_markdown)
+        )
 
         # Call the function
-        result = extract_content(test_file)
+        result = extract_content(fake_pdf)
 
         # Assertions
         assert result == "Extracted content"
         mock_converter_class.assert_called_once()
-        mock_converter.convert.assert_called_once_with(str(test_file))
-        mock_result.document.export_to_markdown.assert_called_once()
-
-    @patch("docling.document_converter.DocumentConverter")
-    def test_returns_none_when_no_document(
-        self, mock_converter_class: Mock, tmp_path: Path
+        mock_converter.convert.assert_called_once_with(str(fake_pdf))
+        export_to_markdown.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("configure", "path_fixture"),
+        [
+            pytest.param(
+                lambda c: setattr(c.convert, "return_value", SimpleNamespace(document=None)),
+                "fake_pdf",
+                id="no_document",
+            ),
+            pytest.param(
+                lambda c: setattr(c.convert, "return_value", None),
+                "fake_pdf",
+                id="no_result",
+            ),
+            pytest.param(
+                lambda c: setattr(c.convert, "side_effect", Exception("Conversion failed")),
+                "fake_pdf",
+                id="conversion_exception",
+            ),
+            pytest.param(
+                lambda c: setattr(
+                    c.convert,
+                    "return_value",
+                    SimpleNamespace(
+                        document=SimpleNamespace(
+                            export_to_markdown=Mock(side_effect=Exception("Export failed"))
+                        )
+                    ),
+                ),
+                "fake_pdf",
+                id="export_exception",
+            ),
+            pytest.param(
+                lambda c: setattr(c.convert, "side_effect", FileNotFoundError("File not found")),
+                "missing_pdf",
+                id="nonexistent_file",
+            ),
+        ],
+    )
+    def test_returns_none_on_failure(
+        self,
+        mock_converter_cls: tuple[Mock, Mock],
+        configure: Callable[[Mock], None],
+        path_fixture: str,
+        request: pytest.FixtureRequest,
     ) -> None:
-        """Test that None is returned when conversion produces no document."""
-        test_file = tmp_path / "test.pdf"
-        test_file.touch()
-
-        # Mock converter with no document in result
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
-
-        mock_result = MagicMock()
-        mock_result.document = None
-        mock_converter.convert.return_value = mock_result
+        """Test that missing results and extraction errors return None instead of raising."""
+        _, mock_converter = mock_converter_cls
+        configure(mock_converter)
 
-        result = extract_content(test_file)
+        result = extract_content(request.getfixturevalue(path_fixture))
 
         assert result is None
 
-    @patch("docling.document_converter.DocumentConverter")
-    def test_returns_none_when_no_result(
-        self, mock_converter_class: Mock, tmp_path: Path
+    def test_converts_path_to_string(
+        self, mock_converter_cls: tuple[Mock, Mock], fake_pdf: Path
     ) -> None:
-        """Test that None is returned when conversion produces no result."""
-        test_file = tmp_path / "test.pdf"
-        test_file.touch()
-
-        # Mock converter with None result
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
-        mock_converter.convert.return_value = None
-
-        result = extract_content(test_file)
-
-        assert result is None
-
-    @patch("docling.document_converter.DocumentConverter")
-    def test_handles_conversion_exception(
-        self, mock_converter_class: Mock, tmp_path: Path
-    ) -> None:
-        """Test that exceptions during conversion are handled gracefully."""
-        test_file = tmp_path / "test.pdf"
-        test_file.touch()
-
-        # Mock converter that raises an exception
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
-        mock_converter.convert.side_effect = Exception("Conversion failed")
-
-        # Should not raise, should return None
-        result = extract_content(test_file)
-
-        assert result is None
-
-    @patch("docling.document_converter.DocumentConverter")
-    def test_handles_export_exception(
-        self, mock_converter_class: Mock, tmp_path: Path
-    ) -> None:
-        """Test that exceptions during markdown export are handled gracefully."""
-        test_file = tmp_path / "test.pdf"
-        test_file.touch()
-
-        # Mock converter with export that raises exception
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
-
-        mock_result = MagicMock()
-        mock_result.document.export_to_markdown.side_effect = Exception("Export failed")
-        mock_converter.convert.return_value = mock_result
-
-        result = extract_content(test_file)
-
-        assert result is None
-
-    @patch("docling.document_converter.DocumentConverter")
-    def test_converts_path_to_string(self, mock_converter_class: Mock, tmp_path: Path) -> None:
         """Test that Path object is converted to string for docling."""
-        test_file = tmp_path / "test.pdf"
-        test_file.touch()
+        _, mock_converter = mock_converter_cls
 
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
+        mock_converter.convert.return_value = SimpleNamespace(
+            document=SimpleNamespace(export_to_markdown=lambda: "Content")
+        )
 
-        mock_result = MagicMock()
-        mock_result.document.export_to_markdown.return_value = "Content"
-        mock_converter.convert.return_value = mock_result
-
-        extract_content(test_file)
+        extract_content(fake_pdf)
 
         # Verify that convert was called with a string, not Path
         call_args = mock_converter.convert.call_args[0][0]
         assert isinstance(call_args, str)
-        assert call_args == str(test_file)
+        assert call_args == str(fake_pdf)
 
-    @patch("docling.document_converter.DocumentConverter")
-    def test_handles_empty_content(self, mock_converter_class: Mock, tmp_path: Path) -> None:
+    def test_handles_empty_content(
+        self, mock_converter_cls: tuple[Mock, Mock], fake_pdf: Path
+    ) -> None:
         """Test handling of documents with empty content."""
-        test_file = tmp_path / "empty.pdf"
-        test_file.touch()
-
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
+        _, mock_converter = mock_converter_cls
 
-        mock_result = MagicMock()
-        mock_result.document.export_to_markdown.return_value = ""
-        mock_converter.convert.return_value = mock_result
+        mock_converter.convert.return_value = SimpleNamespace(
+            document=SimpleNamespace(export_to_markdown=lambda: "")
+        )
 
-        result = extract_content(test_file)
+        result = extract_content(fake_pdf)
 
         # Empty string is still valid content
         assert result == ""
-
-    @patch("docling.document_converter.DocumentConverter")
-    def test_handles_nonexistent_file(
-        self, mock_converter_class: Mock, tmp_path: Path
-    ) -> None:
-        """Test handling of nonexistent files."""
-        test_file = tmp_path / "nonexistent.pdf"
-
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
-        mock_converter.convert.side_effect = FileNotFoundError("File not found")
-
-        result = extract_content(test_file)
-
-        assert result is None
@@ -1,6 +1,12 @@
 """Unit tests for prompt_builder module."""
 
+import json
+import os
+import re
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from docman.prompt_builder import (
     _detect_existing_directories,
@@ -17,7 +23,17 @@ from docman.prompt_builder import (
     get_examples,
     serialize_folder_definitions,
 )
-from docman.repo_config import FolderDefinition
+from docman.repo_config import FolderDefinition, add_pattern_value, set_variable_pattern
+
+# Matches the truncation marker and captures the omitted character count
+MARKER_RE = re.compile(r"<<<DOCMAN_TRUNCATION: ([\d,]+) characters omitted>>>")
+
+
+@pytest.fixture(scope="module")
+def system_prompt() -> str:
+    """Render the default system prompt once for tests that only read it."""
+    clear_prompt_cache()
+    return build_system_prompt()
 
 
 class TestTruncateContentSmart:
@@ -66,22 +82,17 @@ class TestTruncateContentSmart:
         assert "characters omitted" in result.lower()
         assert was_truncated is True
 
-    def test_truncation_respects_max_chars(self) -> None:
+    @pytest.mark.parametrize("content_len", [10000, 20000, 100000, 1000000])
+    def test_truncation_respects_max_chars(self, content_len: int) -> None:
         """Test that truncated result never exceeds max_chars."""
-        for content_len in [10000, 20000, 100000, 1000000]:
-            content = "x" * content_len
-            max_chars = 8000
+        content = "x" * content_len
+        max_chars = 8000
 
-            result, was_truncated, _, _ = _truncate_content_smart(
-                content, max_chars=max_chars
-            )
+        result, was_truncated, _, _ = _truncate_content_smart(content, max_chars=max_chars)
 
-            # Result should never exceed max_chars
-            assert len(result) <= max_chars, (
-                f"Result length {len(result)} exceeds max_chars {max_chars} "
-                f"for content length {content_len}"
-            )
-            assert was_truncated is True
+        # Result should never exceed max_chars
+        assert len(result) <= max_chars
+        assert was_truncated is True
 
     def test_truncation_preserves_tail(self) -> None:
         """Test that truncation specifically preserves end content."""
@@ -147,9 +158,8 @@ class TestTruncateContentSmart:
         result2, _, _, _ = _truncate_content_smart(content2, max_chars=8000)
 
         # Extract omitted counts from markers
-        import re
-        match1 = re.search(r"<<<DOCMAN_TRUNCATION: ([\d,]+) characters omitted>>>", result1)
-        match2 = re.search(r"<<<DOCMAN_TRUNCATION: ([\d,]+) characters omitted>>>", result2)
+        match1 = MARKER_RE.search(result1)
+        match2 = MARKER_RE.search(result2)
 
         assert match1 is not None
         assert match2 is not None
@@ -207,7 +217,6 @@ class TestTruncateContentSmart:
     def test_truncation_invalid_ratio_zero(self) -> None:
         """Test that head_ratio of 0.0 raises ValueError."""
         content = "x" * 10000
-        import pytest
 
         with pytest.raises(ValueError, match="must be between 0.0 and 1.0"):
             _truncate_content_smart(content, max_chars=8000, head_ratio=0.0)
@@ -215,7 +224,6 @@ class TestTruncateContentSmart:
     def test_truncation_invalid_ratio_one(self) -> None:
         """Test that head_ratio of 1.0 raises ValueError."""
         content = "x" * 10000
-        import pytest
 
         with pytest.raises(ValueError, match="must be between 0.0 and 1.0"):
             _truncate_content_smart(content, max_chars=8000, head_ratio=1.0)
@@ -223,7 +231,6 @@ class TestTruncateContentSmart:
     def test_truncation_invalid_ratio_negative(self) -> None:
         """Test that negative head_ratio raises ValueError."""
         content = "x" * 10000
-        import pytest
 
         with pytest.raises(ValueError, match="must be between 0.0 and 1.0"):
             _truncate_content_smart(content, max_chars=8000, head_ratio=-0.5)
@@ -231,7 +238,6 @@ class TestTruncateContentSmart:
     def test_truncation_invalid_ratio_greater_than_one(self) -> None:
         """Test that head_ratio > 1.0 raises ValueError."""
         content = "x" * 10000
-        import pytest
 
         with pytest.raises(ValueError, match="must be between 0.0 and 1.0"):
             _truncate_content_smart(content, max_chars=8000, head_ratio=1.5)
@@ -285,18 +291,14 @@ class TestTruncateContentSmart:
 class TestBuildSystemPrompt:
     """Tests for build_system_prompt function."""
 
-    def test_returns_non_empty_string(self) -> None:
+    def test_returns_non_empty_string(self, system_prompt: str) -> None:
         """Test that system prompt is not empty."""
-        # Clear cache to ensure fresh result
-        clear_prompt_cache()
-        result = build_system_prompt()
-        assert isinstance(result, str)
-        assert len(result) > 0
+        assert isinstance(system_prompt, str)
+        assert len(system_prompt) > 0
 
-    def test_contains_key_elements(self) -> None:
+    def test_contains_key_elements(self, system_prompt: str) -> None:
         """Test that system prompt contains expected elements."""
-        clear_prompt_cache()
-        result = build_system_prompt()
+        result = system_prompt
 
         # Should mention document management expertise
         assert "document management specialist" in result.lower()
@@ -304,16 +306,16 @@ class TestBuildSystemPrompt:
         # Should mention JSON format
         assert "JSON" in result or "json" in result
 
-        # Should mention required fields
-        assert "suggested_directory_path" in result
-        assert "suggested_filename" in result
-        assert "reason" in result
-
-        # Should have critical guidelines section
-        assert "Critical Guidelines" in result
-
-        # Should explain existing values (Guideline #6 fix)
-        assert "Existing:" in result
+        # Should mention the required fields, have the critical guidelines
+        # section and explain existing values (Guideline #6 fix)
+        for token in (
+            "suggested_directory_path",
+            "suggested_filename",
+            "reason",
+            "Critical Guidelines",
+            "Existing:",
+        ):
+            assert token in result, f"{token!r} missing from system prompt"
 
     def test_caching(self) -> None:
         """Test that system prompt is cached."""
@@ -377,8 +379,6 @@ class TestBuildSystemPrompt:
 
     def test_generate_schema_example_returns_valid_json(self) -> None:
         """Test that _generate_schema_example returns valid JSON with expected fields."""
-        import json
-
         example = _generate_schema_example()
 
         # Should be valid JSON
@@ -392,8 +392,6 @@ class TestBuildSystemPrompt:
 
     def test_generate_schema_example_uses_field_descriptions(self) -> None:
         """Test that _generate_schema_example uses Field descriptions from the model."""
-        import json
-
         example = _generate_schema_example()
         parsed = json.loads(example)
 
@@ -615,8 +613,6 @@ class TestGenerateInstructionsFromFolders:
 
     def test_variable_pattern_extraction(self, tmp_path: Path) -> None:
         """Test that variable patterns are detected and documented."""
-        from docman.repo_config import set_variable_pattern
-
         set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
 
         folders = {
@@ -641,8 +637,6 @@ class TestGenerateInstructionsFromFolders:
 
     def test_multiple_variable_patterns(self, tmp_path: Path) -> None:
         """Test that multiple variable patterns are documented."""
-        from docman.repo_config import set_variable_pattern
-
         set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
         set_variable_pattern(tmp_path, "category", "Document category")
 
@@ -659,8 +653,9 @@ class TestGenerateInstructionsFromFolders:
         result = generate_instructions_from_folders(folders, tmp_path)
 
         # Should document both patterns
-        assert "year" in result.lower()
-        assert "category" in result.lower()
+        lowered = result.lower()
+        assert "year" in lowered
+        assert "category" in lowered
         assert "4-digit year" in result
         assert "Document category" in result
 
@@ -689,8 +684,6 @@ class TestGenerateInstructionsFromFolders:
 
     def test_includes_existing_directories(self, tmp_path: Path) -> None:
         """Test that existing directories are included in generated instructions."""
-        from docman.repo_config import set_variable_pattern
-
         # Create directory structure
         financial_dir = tmp_path / "Financial"
         financial_dir.mkdir()
@@ -716,8 +709,6 @@ class TestGenerateInstructionsFromFolders:
 
     def test_existing_directories_multiple_patterns(self, tmp_path: Path) -> None:
         """Test existing directories for multiple variable patterns."""
-        from docman.repo_config import set_variable_pattern
-
         # Create directory structure
         financial_dir = tmp_path / "Financial"
         financial_dir.mkdir()
@@ -755,8 +746,6 @@ class TestGenerateInstructionsFromFolders:
 
     def test_no_existing_dirs_when_empty(self, tmp_path: Path) -> None:
         """Test that no existing line appears when directories don't exist."""
-        from docman.repo_config import set_variable_pattern
-
         # Create parent but no children
         financial_dir = tmp_path / "Financial"
         financial_dir.mkdir()
@@ -925,10 +914,22 @@ class TestExtractVariablePatterns:
         result = _extract_variable_patterns(folders, tmp_path)
         assert result == {}
 
+    def test_variables_only_in_filename_conventions(self, tmp_path: Path) -> None:
+        """Test extraction when only filename conventions use variables."""
+        set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
+        set_variable_pattern(tmp_path, "vendor", "Vendor name")
+
+        folders = {
+            "Invoices": FolderDefinition(
+                folders={"Paid": FolderDefinition(filename_convention="{vendor}-invoice")}
+            ),
+        }
+
+        result = _extract_variable_patterns(folders, tmp_path, "{year}-document")
+        assert set(result) == {"year", "vendor"}
+
     def test_single_variable(self, tmp_path: Path) -> None:
         """Test extraction of single variable pattern."""
-        from docman.repo_config import set_variable_pattern
-
         set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
 
         folders = {
@@ -942,8 +943,6 @@ class TestExtractVariablePatterns:
 
     def test_multiple_variables(self, tmp_path: Path) -> None:
         """Test extraction of multiple variable patterns."""
-        from docman.repo_config import set_variable_pattern
-
         set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
         set_variable_pattern(tmp_path, "category", "Document category")
 
@@ -956,10 +955,42 @@ class TestExtractVariablePatterns:
         assert "year" in result
         assert "category" in result
 
+    def test_embedded_variables_in_folder_name(self, tmp_path: Path) -> None:
+        """Test extraction of variables embedded in a longer folder name."""
+        set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
+        set_variable_pattern(tmp_path, "quarter", "Fiscal quarter")
+
+        folders = {
+            "FY{year}-{quarter}": FolderDefinition(description="By period", folders={}),
+        }
+
+        result = _extract_variable_patterns(folders, tmp_path)
+        assert set(result) == {"year", "quarter"}
+
+    @pytest.mark.parametrize(
+        ("folder_name", "expected"),
+        [
+            pytest.param("{year}", ["year"], id="whole-name"),
+            pytest.param("{year}-{quarter}", ["year", "quarter"], id="multiple"),
+            pytest.param("{}", [], id="empty-braces"),
+            pytest.param("{ year }", [], id="padded-name"),
+            pytest.param("{fiscal-year}", [], id="non-word-name"),
+            pytest.param("{a{b}", ["b"], id="nested-open-brace"),
+        ],
+    )
+    def test_only_word_placeholders_are_variables(
+        self, tmp_path: Path, capsys, folder_name: str, expected: list[str]
+    ) -> None:
+        """Test that folder names only yield {word} placeholders, never malformed ones."""
+        folders = {folder_name: FolderDefinition(description="By value", folders={})}
+
+        result = _extract_variable_patterns(folders, tmp_path)
+
+        assert list(result) == expected
+        assert "Variable pattern '' is undefined" not in capsys.readouterr().out
+
     def test_nested_variables(self, tmp_path: Path) -> None:
         """Test extraction of variables in nested structure."""
-        from docman.repo_config import set_variable_pattern
-
         set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
         set_variable_pattern(tmp_path, "month", "2-digit month in MM format")
 
@@ -981,6 +1012,30 @@ class TestExtractVariablePatterns:
         assert "year" in result
         assert "month" in result
 
+    def test_repeated_variable_resolved_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a variable used in several places is resolved only once."""
+        resolved: list[str] = []
+
+        def fake_guidance(variable_name: str, repo_root: Path) -> str:
+            resolved.append(variable_name)
+            return f"guidance for {variable_name}"
+
+        monkeypatch.setattr("docman.prompt_builder._get_pattern_guidance", fake_guidance)
+
+        folders = {
+            "Invoices": FolderDefinition(
+                folders={"{year}": FolderDefinition(filename_convention="{year}-{vendor}")}
+            ),
+            "Receipts": FolderDefinition(folders={"{year}": FolderDefinition()}),
+        }
+
+        result = _extract_variable_patterns(folders, tmp_path, "{year}-document")
+
+        assert resolved == ["year", "vendor"]
+        assert list(result) == ["year", "vendor"]
+
     def test_undefined_variable_shows_warning(self, tmp_path: Path, capsys) -> None:
         """Test that using undefined variable shows warning and continues."""
         folders = {
@@ -1005,8 +1060,6 @@ class TestGetPatternGuidance:
 
     def test_defined_pattern(self, tmp_path: Path) -> None:
         """Test guidance for defined pattern."""
-        from docman.repo_config import set_variable_pattern
-
         set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
 
         result = _get_pattern_guidance("year", tmp_path)
@@ -1014,8 +1067,6 @@ class TestGetPatternGuidance:
 
     def test_multiple_patterns(self, tmp_path: Path) -> None:
         """Test guidance for multiple defined patterns."""
-        from docman.repo_config import set_variable_pattern
-
         set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
         set_variable_pattern(tmp_path, "category", "Document category")
 
@@ -1039,10 +1090,35 @@ class TestGetPatternGuidance:
         # Verify fallback guidance is returned
         assert "Infer year from document context" in result
 
+    def test_undefined_pattern_warned_once_per_extraction(
+        self, tmp_path: Path, capsys
+    ) -> None:
+        """Test that an undefined pattern is reported once per call, not once per process."""
+        folders = {
+            "{year}": FolderDefinition(filename_convention="{year}-report"),
+            "Archive": FolderDefinition(folders={"{year}": FolderDefinition()}),
+        }
+
+        _extract_variable_patterns(folders, tmp_path)
+        assert capsys.readouterr().out.count("Variable pattern 'year' is undefined") == 1
+
+        # A later, unrelated call reports it again
+        result = _get_pattern_guidance("year", tmp_path)
+        assert capsys.readouterr().out.count("Variable pattern 'year' is undefined") == 1
+        assert "Infer year from document context" in result
+
+    def test_cached_guidance_refreshed_after_config_change(self, tmp_path: Path) -> None:
+        """Test that cached guidance is rebuilt when the repository config changes."""
+        set_variable_pattern(tmp_path, "year", "Year")
+        assert _get_pattern_guidance("year", tmp_path) == _get_pattern_guidance("year", tmp_path)
+
+        set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
+        result = _get_pattern_guidance("year", tmp_path)
+
+        assert "4-digit year in YYYY format" in result
+
     def test_pattern_description_formatting(self, tmp_path: Path) -> None:
         """Test that pattern description is formatted correctly."""
-        from docman.repo_config import set_variable_pattern
-
         set_variable_pattern(tmp_path, "custom", "Extract custom value from document")
 
         result = _get_pattern_guidance("custom", tmp_path)
@@ -1052,8 +1128,6 @@ class TestGetPatternGuidance:
 
     def test_guidance_with_values(self, tmp_path: Path) -> None:
         """Test that guidance includes predefined values."""
-        from docman.repo_config import add_pattern_value, set_variable_pattern
-
         set_variable_pattern(tmp_path, "company", "Company name from document")
         add_pattern_value(tmp_path, "company", "Acme Corp.", "Main company")
         add_pattern_value(tmp_path, "company", "Beta Inc.")
@@ -1071,8 +1145,6 @@ class TestGetPatternGuidance:
 
     def test_guidance_with_aliases(self, tmp_path: Path) -> None:
         """Test that guidance includes aliases for values."""
-        from docman.repo_config import add_pattern_value, set_variable_pattern
-
         set_variable_pattern(tmp_path, "company", "Company name from document")
         add_pattern_value(tmp_path, "company", "Acme Corp.", "Current name after merger")
         add_pattern_value(tmp_path, "company", "XYZ Corp", alias_of="Acme Corp.")
@@ -1087,8 +1159,6 @@ class TestGetPatternGuidance:
 
     def test_guidance_with_mixed_simple_and_extended(self, tmp_path: Path) -> None:
         """Test guidance generation with both simple and extended patterns."""
-        from docman.repo_config import add_pattern_value, set_variable_pattern
-
         # Simple pattern (no values)
         set_variable_pattern(tmp_path, "year", "4-digit year in YYYY format")
 
@@ -1259,6 +1329,75 @@ class TestDetectExistingDirectories:
         assert result["Parent/{year}"] == ["2023"]
         assert "2024.txt" not in result["Parent/{year}"]
 
+    def test_embedded_placeholder_folder_is_literal(self, tmp_path: Path) -> None:
+        """Test that a folder with an embedded placeholder is not listed as a variable."""
+        (tmp_path / "Reports" / "Draft").mkdir(parents=True)
+
+        folders = {
+            "Reports": FolderDefinition(
+                folders={"FY{year}": FolderDefinition(description="Fiscal year")},
+            ),
+        }
+
+        result = _detect_existing_directories(folders, tmp_path)
+        assert result == {}
+
+    def test_skips_symlinked_directories(self, tmp_path: Path) -> None:
+        """Test that symlinks to directories are not reported as existing values."""
+        parent_dir = tmp_path / "Parent"
+        parent_dir.mkdir()
+        (parent_dir / "2023").mkdir()
+        outside_dir = tmp_path / "outside"
+        outside_dir.mkdir()
+        try:
+            (parent_dir / "2024").symlink_to(outside_dir, target_is_directory=True)
+        except OSError:
+            pytest.skip("Symlinks are not supported on this platform")
+
+        folders = {
+            "Parent": FolderDefinition(
+                description="Parent folder",
+                folders={
+                    "{year}": FolderDefinition(description="By year", folders={}),
+                },
+            ),
+        }
+
+        result = _detect_existing_directories(folders, tmp_path)
+        assert result["Parent/{year}"] == ["2023"]
+
+    def test_scans_each_directory_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a directory reached through two definitions is listed once."""
+        (tmp_path / "Archive" / "2023").mkdir(parents=True)
+        (tmp_path / "Archive" / "2024").mkdir()
+
+        # "Archive" is both a literal folder and a value of the {category} sibling
+        folders = {
+            "Archive": FolderDefinition(
+                folders={"{year}": FolderDefinition(description="By year")},
+            ),
+            "{category}": FolderDefinition(
+                folders={"{year}": FolderDefinition(description="By year")},
+            ),
+        }
+
+        scanned: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: str) -> Any:
+            scanned.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        result = _detect_existing_directories(folders, tmp_path)
+
+        assert result["Archive/{year}"] == ["2023", "2024"]
+        assert result["{category}/{year}"] == ["2023", "2024"]
+        assert len(scanned) == len(set(scanned))
+
     def test_sorted_alphabetically(self, tmp_path: Path) -> None:
         """Test that results are sorted alphabetically."""
         # Use nested structure to avoid tmp_path's app_config dir
@@ -1450,6 +1589,12 @@ class TestDetectExistingDirectories:
         assert result["Region/{region}/{client}/{year}"] == ["2023", "2024"]
 
 
+def _roundtrip(folders: dict[str, FolderDefinition]) -> dict[str, Any]:
+    """Serialize folder definitions and parse the JSON back into a dict."""
+    parsed: dict[str, Any] = json.loads(serialize_folder_definitions(folders))
+    return parsed
+
+
 class TestSerializeFolderDefinitions:
     """Tests for serialize_folder_definitions function."""
 
@@ -1464,11 +1609,9 @@ class TestSerializeFolderDefinitions:
             "Documents": FolderDefinition(description="All documents", folders={}),
         }
 
-        result = serialize_folder_definitions(folders)
-        assert isinstance(result, str)
+        assert isinstance(serialize_folder_definitions(folders), str)
         # Should be valid JSON
-        import json
-        parsed = json.loads(result)
+        parsed = _roundtrip(folders)
         assert "folders" in parsed
         assert "Documents" in parsed["folders"]
         assert parsed["folders"]["Documents"]["description"] == "All documents"
@@ -1484,9 +1627,7 @@ class TestSerializeFolderDefinitions:
             ),
         }
 
-        result = serialize_folder_definitions(folders)
-        import json
-        parsed = json.loads(result)
+        parsed = _roundtrip(folders)
 
         assert "folders" in parsed
         assert "Financial" in parsed["folders"]
@@ -1506,7 +1647,6 @@ class TestSerializeFolderDefinitions:
         assert result1 == result2
 
         # Keys should be sorted (A before B)
-        import json
         parsed = json.loads(result1)
         keys = list(parsed.keys())
         assert keys == sorted(keys)
@@ -1,5 +1,6 @@
 """Unit tests for repo_config module."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -10,12 +11,44 @@ from docman.repo_config import (
     get_default_filename_convention,
     get_folder_definitions,
     get_repo_config_path,
+    is_variable_pattern,
     load_repo_config,
     save_repo_config,
     set_default_filename_convention,
 )
 
 
+class TestIsVariablePattern:
+    """Tests for is_variable_pattern helper function."""
+
+    @pytest.mark.parametrize(
+        ("folder_name", "expected"),
+        [
+            # Variable patterns are correctly identified
+            ("{year}", True),
+            ("{category}", True),
+            ("{company}", True),
+            # Literal folder names are not variable patterns
+            ("Financial", False),
+            ("invoices", False),
+            ("2024", False),
+            # Partial braces are not variable patterns
+            ("{year", False),
+            ("year}", False),
+            ("year", False),
+            # Malformed placeholders are literal folder names
+            ("{}", False),
+            ("{ year }", False),
+            ("{fiscal-year}", False),
+            ("{a{b}", False),
+            ("{year}-{month}", False),
+        ],
+    )
+    def test_is_variable_pattern(self, folder_name: str, expected: bool):
+        """Variable patterns are distinguished from literal and partial names."""
+        assert is_variable_pattern(folder_name) is expected
+
+
 class TestFolderDefinition:
     """Tests for FolderDefinition dataclass."""
 
@@ -218,6 +251,36 @@ class TestLoadRepoConfig:
 
         assert "invalid YAML syntax" in str(exc_info.value)
 
+    def test_cached_config_returned_as_independent_copies(self, tmp_path: Path) -> None:
+        """Test that repeated loads do not share mutable state."""
+        save_repo_config(tmp_path, {"organization": {"folders": {}}})
+
+        first = load_repo_config(tmp_path)
+        first["organization"]["folders"]["Scratch"] = {}
+        second = load_repo_config(tmp_path)
+
+        assert second == {"organization": {"folders": {}}}
+
+    def test_same_size_save_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test that a save is visible even if file size and mtime tick are unchanged."""
+        save_repo_config(tmp_path, {"key": "aaaa"})
+        assert load_repo_config(tmp_path) == {"key": "aaaa"}
+
+        save_repo_config(tmp_path, {"key": "bbbb"})
+        assert load_repo_config(tmp_path) == {"key": "bbbb"}
+
+    def test_external_rewrite_with_same_size_and_mtime_is_seen(self, tmp_path: Path) -> None:
+        """Test that an edit outside docman is seen even if size and mtime match."""
+        save_repo_config(tmp_path, {"key": "aaaa"})
+        assert load_repo_config(tmp_path) == {"key": "aaaa"}
+
+        config_path = get_repo_config_path(tmp_path)
+        stat = config_path.stat()
+        config_path.write_text("key: bbbb\n")
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_repo_config(tmp_path) == {"key": "bbbb"}
+
 
 class TestSaveRepoConfig:
     """Tests for save_repo_config function."""
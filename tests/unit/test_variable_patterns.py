@@ -318,6 +318,21 @@ class TestVariablePatternDataclass:
         assert vp.values[0].value == "Acme Corp."
         assert vp.values[0].description == "Main company"
 
+    def test_known_values_includes_values_and_aliases(self) -> None:
+        """Test known_values contains canonical values and all aliases."""
+        vp = VariablePattern(
+            description="Company name",
+            values=[
+                PatternValue(value="Acme Corp.", aliases=["Acme", "ACME"]),
+                PatternValue(value="XYZ Inc."),
+            ],
+        )
+        assert vp.known_values == frozenset({"Acme Corp.", "Acme", "ACME", "XYZ Inc."})
+
+    def test_known_values_empty_without_values(self) -> None:
+        """Test known_values is empty when no predefined values exist."""
+        assert VariablePattern(description="4-digit year").known_values == frozenset()
+
 
 class TestAddPatternValue:
     """Tests for add_pattern_value function."""